@@ -19,21 +19,25 @@ Social
 """
 
 import os
+import sys
 import argparse
-from scripts import XMLToJsonlConverter
-
-# These types reflect the different directory structure of the IGC subcorpora. If new subcorpora are added, they need to be listed here.
-corpus_types = {
-    "Adjud": 1,
-    "Journals": 1,
-    "Law": 1,
-    "Books": 2,
-    "Parla": 2,
-    "Wiki": 2,
-    "News1": 3,
-    "News2": 3,
-    "Social": 4,
-}
+from scripts import XMLToJsonlConverter, LARGE_DOC_THRESHOLD, get_registry
+
+
+def validate(converters: list) -> bool:
+    """Check that every subcorpus directory found on disk resolves in the corpus registry."""
+
+    valid = True
+    for converter in converters:
+        if not os.path.isdir(converter.input_path):
+            print(f"Input directory not found: {converter.input_path}")
+            valid = False
+            continue
+        for name in converter.validate():
+            print(f"Subcorpus not found in the corpus registry: {name}")
+            valid = False
+
+    return valid
 
 
 def main(arguments):
@@ -42,31 +46,58 @@ def main(arguments):
     all_corpora = arguments.all_corpora
     corpus = arguments.corpus
     output_path = arguments.output_path if arguments.output_path else "./output/"
+    large_doc_threshold = (
+        arguments.large_doc_threshold * 1024 * 1024
+        if arguments.large_doc_threshold is not None
+        else LARGE_DOC_THRESHOLD
+    )
+    report_memory = arguments.report_memory
+    registry = get_registry()
 
     if all_corpora:
-        print(f"Converting IGC version {version}. Output path is {output_path}")
-        for corpus in corpus_types:
-            converter = XMLToJsonlConverter(
-                corpus,
-                os.path.join(input_path, f"IGC-{corpus}-{version}.TEI/"),
-                output_path,
-            )
-            converter.create_jsonl(corpus_types[corpus])
-
+        corpora = list(registry.corpora)
     elif corpus:
         if corpus.startswith("IGC-"):
             corpus = corpus.split("IGC-")[1]
-        print(
-            f"Converting IGC-{corpus} version {version}. Output path is {output_path}"
-        )
-        converter = XMLToJsonlConverter(
+        if corpus not in registry.corpora:
+            print(
+                f"Unknown corpus IGC-{corpus}. Known corpora are: "
+                + ", ".join(f"IGC-{c}" for c in registry.corpora)
+            )
+            sys.exit(1)
+        corpora = [corpus]
+    else:
+        print("Please provide either --all-corpora or --corpus")
+        return
+
+    converters = [
+        XMLToJsonlConverter(
             corpus,
             os.path.join(input_path, f"IGC-{corpus}-{version}.TEI/"),
             output_path,
+            large_doc_threshold,
+            report_memory,
+            version,
+            registry,
         )
-        converter.create_jsonl(corpus_types[corpus])
+        for corpus in corpora
+    ]
+
+    # Check all subcorpora before converting, so that a long conversion doesn't fail part way through
+    if not validate(converters):
+        sys.exit(1)
+    if arguments.validate:
+        print("All subcorpora resolve in the corpus registry")
+        return
+
+    if all_corpora:
+        print(f"Converting IGC version {version}. Output path is {output_path}")
     else:
-        print("Please provide either --all-corpora or --corpus")
+        print(
+            f"Converting IGC-{corpus} version {version}. Output path is {output_path}"
+        )
+    for converter in converters:
+        converter.create_jsonl()
 
 
 if __name__ == "__main__":
@@ -106,5 +137,23 @@ if __name__ == "__main__":
     parser.add_argument(
         "--output-path", "-o", type=str, help="Output path", required=False
     )
+    parser.add_argument(
+        "--large-doc-threshold",
+        type=int,
+        help="Size in MB from which XML files are converted with the bounded-memory large document path",
+        required=False,
+    )
+    parser.add_argument(
+        "--report-memory",
+        action="store_true",
+        help="Report the peak memory used for each converted document",
+        required=False,
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Only check that every subcorpus directory on disk resolves in the corpus registry",
+        required=False,
+    )
     args = parser.parse_args()
     main(args)
@@ -1 +1,2 @@
-from .convert_xml import XMLToJsonlConverter
+from .convert_xml import XMLToJsonlConverter, LARGE_DOC_THRESHOLD
+from .corpus_registry import CorpusRegistry, get_registry
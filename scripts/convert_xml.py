@@ -2,86 +2,60 @@ import json
 import os
 import xml.etree.ElementTree as ET
 import uuid
+import itertools
+import tracemalloc
+from array import array
 from tokenizer import split_into_sentences
 from datetime import date
-
-# Path to the TSV file containing information on the corpora
-INFO_MAP_FILE = "./subcorpora_categorization.tsv"
+from .corpus_registry import CorpusRegistry, get_registry
 
 # XML namespaces
 XML_NAMESPACE = "{http://www.tei-c.org/ns/1.0}"
 XML_ID_NAMESPACE = "{http://www.w3.org/XML/1998/namespace}"
 
-# Paragraph and title types for each subcorpus
-PARAGRAPH_TYPES = {
-    "Adjud": 1,
-    "Books": 1,
-    "Journals": 1,
-    "Law": 1,
-    "News1": 1,
-    "News2": 1,
-    "Parla": 2,
-    "Social": 1,
-    "Wiki": 1,
-}
-TITLE_TYPES = {
-    "Adjud": 1,
-    "Books": 1,
-    "Journals": 1,
-    "Law": 2,
-    "News1": 1,
-    "News2": 1,
-    "Parla": 3,
-    "Social": 1,
-    "Wiki": 1,
-}
+# XML files at or above this size (in bytes) are converted with the large document path,
+# which computes offsets into integer arrays and writes the JSON line incrementally
+LARGE_DOC_THRESHOLD = 50 * 1024 * 1024
 
 
 class XMLToJsonlConverter:
     """Convert XML files to JSONL format."""
 
-    def __init__(self, corpus: str, input_path: str, output_path: str) -> None:
+    def __init__(
+        self,
+        corpus: str,
+        input_path: str,
+        output_path: str,
+        large_doc_threshold: int = LARGE_DOC_THRESHOLD,
+        report_memory: bool = False,
+        version: str = None,
+        registry: CorpusRegistry = None,
+    ) -> None:
         self.corpus = corpus
         self.input_path = input_path
         self.output_path = output_path
+        # The version is taken from the input path, e.g. IGC-Adjud-22.10.TEI/, if it is not given
+        self.version = (
+            version
+            if version is not None
+            else input_path.split("/")[-2].split("-")[-1].rsplit(".", 1)[0]
+        )
+        self.registry = registry if registry is not None else get_registry()
+        self.corpus_config = self.registry.corpora[corpus]
+        self.large_doc_threshold = large_doc_threshold
+        self.report_memory = report_memory
+        self.memory_report = []
 
-    def get_info_map(self) -> dict:
-        """Get the information map for all listed corpora."""
-
-        # Read the tsv file containing information on the corpora
-        with open(INFO_MAP_FILE, "r") as f:
-            info_map = {}
-            # Skip the header in the file
-            next(f)
-            for line in f:
-                info = line.split("\t")
-                corpus_name = info[0].split(".tsv")[0]
-                domain = info[1].lower()
-                if "–" in domain:
-                    domain = [d.strip() for d in domain.split("–")]
-                else:
-                    domain = [domain]
-                lang = "is"
-                quality = info[-1].strip()
-                info_map[corpus_name] = {
-                    "domain": domain,
-                    "lang": lang,
-                    "quality": quality,
-                }
-
-            return info_map
+    def iter_paragraphs(self, paragraphs: ET, type):
+        """Yield the text of each paragraph in the XML file, one paragraph at a time."""
 
-    def get_paragraphs(self, paragraphs: ET, type) -> list:
-        """Get the text from the paragraphs in the XML file."""
-
-        clean_paragraphs = []
         for section in paragraphs:
             for paragraph in section:
                 if type == 1:
                     text = paragraph.text
                     if text != "" and text is not None:
-                        # Each paragraph is a single string in the clean_paragraphs list
-                        clean_paragraphs.append(text)
+                        # Each paragraph is a single string
+                        yield text
                 elif type == 2:
                     # This only applies to parliamentary data, where each paragraph is a speech from one speaker
                     paragraph_text = []
@@ -90,10 +64,13 @@ class XMLToJsonlConverter:
                         if text != "" and text is not None:
                             # Each segment is a part of the paragraph
                             paragraph_text.append(text)
-                    # Each paragraph is a single string in the clean_paragraphs list
-                    clean_paragraphs.append(" ".join(paragraph_text))
+                    # Each paragraph is a single string
+                    yield " ".join(paragraph_text)
+
+    def get_paragraphs(self, paragraphs: ET, type) -> list:
+        """Get the text from the paragraphs in the XML file."""
 
-        return clean_paragraphs
+        return list(self.iter_paragraphs(paragraphs, type))
 
     def get_title(self, title_list: list, title_type: int) -> tuple:
         """Get the title information from the XML file."""
@@ -213,64 +190,71 @@ class XMLToJsonlConverter:
 
         return doc_object
 
-    def convert_to_jsonl(self, input_file: str) -> dict:
-        """Convert an XML file to JSONL format."""
+    def get_source_info(self, root: ET.Element) -> tuple:
+        """Get the title, author, source and publishing date from the header of the XML file."""
+
+        header = root[0]
+        file_desc = header[0]
+
+        source_desc = [
+            el for el in file_desc if el.tag == f"{XML_NAMESPACE}sourceDesc"
+        ][0]
+        # There are two structures to sourceDesc and we need to account for both
+        bibl = source_desc.findall(f"{XML_NAMESPACE}biblStruct")
+        if len(bibl) == 0:
+            bibl = source_desc.findall(f"{XML_NAMESPACE}bibl")
+            for el in bibl:
+                title = el.findall(f"{XML_NAMESPACE}title")
+                author = el.findall(f"{XML_NAMESPACE}author")
+                source = el.findall(f"{XML_NAMESPACE}idno")
+                publish_timestamp = el.findall(f"{XML_NAMESPACE}date")
+        else:
+            bibl_info = bibl[0].findall(f"{XML_NAMESPACE}analytic")
+
+            if len(bibl_info) == 0:
+                for el in bibl[0].findall(f"{XML_NAMESPACE}monogr"):
 
-        with open(input_file, "r") as f:
-            tree = ET.parse(f)
-            root = tree.getroot()
-            xml_id = root.attrib.get(f"{XML_ID_NAMESPACE}id")
-            header = root[0]
-            file_desc = header[0]
-
-            source_desc = [
-                el for el in file_desc if el.tag == f"{XML_NAMESPACE}sourceDesc"
-            ][0]
-            # There are two structures to sourceDesc and we need to account for both
-            bibl = source_desc.findall(f"{XML_NAMESPACE}biblStruct")
-            if len(bibl) == 0:
-                bibl = source_desc.findall(f"{XML_NAMESPACE}bibl")
-                for el in bibl:
                     title = el.findall(f"{XML_NAMESPACE}title")
                     author = el.findall(f"{XML_NAMESPACE}author")
                     source = el.findall(f"{XML_NAMESPACE}idno")
                     publish_timestamp = el.findall(f"{XML_NAMESPACE}date")
-            else:
-                bibl_info = bibl[0].findall(f"{XML_NAMESPACE}analytic")
 
-                if len(bibl_info) == 0:
-                    for el in bibl[0].findall(f"{XML_NAMESPACE}monogr"):
+                if len(publish_timestamp) == 0:
 
-                        title = el.findall(f"{XML_NAMESPACE}title")
-                        author = el.findall(f"{XML_NAMESPACE}author")
-                        source = el.findall(f"{XML_NAMESPACE}idno")
-                        publish_timestamp = el.findall(f"{XML_NAMESPACE}date")
+                    for imprint in el.findall(f"{XML_NAMESPACE}imprint"):
+                        publish_timestamp = imprint.findall(f"{XML_NAMESPACE}date")
 
-                    if len(publish_timestamp) == 0:
+            else:
+                for el in bibl_info:
+                    title = el.findall(f"{XML_NAMESPACE}title")
+                    author = el.findall(f"{XML_NAMESPACE}author")
+                    source = el.findall(f"{XML_NAMESPACE}idno")
+                    publish_timestamp = el.findall(f"{XML_NAMESPACE}date")
 
-                        for imprint in el.findall(f"{XML_NAMESPACE}imprint"):
-                            publish_timestamp = imprint.findall(f"{XML_NAMESPACE}date")
+                if len(publish_timestamp) == 0:
 
-                else:
-                    for el in bibl_info:
-                        title = el.findall(f"{XML_NAMESPACE}title")
-                        author = el.findall(f"{XML_NAMESPACE}author")
-                        source = el.findall(f"{XML_NAMESPACE}idno")
-                        publish_timestamp = el.findall(f"{XML_NAMESPACE}date")
+                    for monogr in bibl[0].findall(f"{XML_NAMESPACE}monogr"):
 
-                    if len(publish_timestamp) == 0:
+                        for el in monogr.findall(f"{XML_NAMESPACE}imprint"):
+                            publish_timestamp = el.findall(f"{XML_NAMESPACE}date")
 
-                        for monogr in bibl[0].findall(f"{XML_NAMESPACE}monogr"):
+        return title, author, source, publish_timestamp
 
-                            for el in monogr.findall(f"{XML_NAMESPACE}imprint"):
-                                publish_timestamp = el.findall(f"{XML_NAMESPACE}date")
+    def convert_to_jsonl(self, input_file: str) -> dict:
+        """Convert an XML file to JSONL format."""
+
+        with open(input_file, "r") as f:
+            tree = ET.parse(f)
+            root = tree.getroot()
+            xml_id = root.attrib.get(f"{XML_ID_NAMESPACE}id")
+            title, author, source, publish_timestamp = self.get_source_info(root)
 
             fetch_timestamp = date.today().strftime("%Y-%m-%d")
             gen_uuid = str(uuid.uuid4())
             text = root[1]
             paragraphs = text[0]
-            paragraph_type = PARAGRAPH_TYPES[self.corpus]
-            title_type = TITLE_TYPES[self.corpus]
+            paragraph_type = self.corpus_config["paragraph_type"]
+            title_type = self.corpus_config["title_type"]
             document, paragraphs, sentences, title_info = self.get_doc_data(
                 paragraphs, title, paragraph_type, title_type
             )
@@ -289,52 +273,160 @@ class XMLToJsonlConverter:
 
             return doc_object
 
-    def get_corpus_info(
-        self, corpus_name: str, output_name: str, info_map: dict
-    ) -> dict:
+    def find_paragraph_breaks(
+        self, text: str, position: int, ends_with_newline: bool, offsets: array
+    ) -> bool:
+        """Add the offset of each paragraph break in a piece of the document, starting at position, to offsets.
+
+        A paragraph starts after every two consecutive newlines, which may span the previous piece of the
+        document. Returns whether the piece ends with a newline.
+        """
+
+        if position == 0 and text:
+            offsets.append(0)
+        if ends_with_newline and text.startswith("\n") and position >= 2:
+            offsets.append(position + 1)
+        i = text.find("\n\n")
+        while i != -1:
+            if position + i >= 1:
+                offsets.append(position + i + 2)
+            i = text.find("\n\n", i + 1)
+
+        return text.endswith("\n") if text else ends_with_newline
+
+    def write_offsets(self, output, offsets: array, lens: array) -> None:
+        """Write offset and length pairs as a JSON list of objects, in chunks."""
+
+        count = min(len(offsets), len(lens))
+        output.write("[")
+        for chunk_start in range(0, count, 4096):
+            if chunk_start:
+                output.write(", ")
+            output.write(
+                ", ".join(
+                    f'{{"offset": {offsets[i]}, "length": {lens[i]}}}'
+                    for i in range(chunk_start, min(chunk_start + 4096, count))
+                )
+            )
+        output.write("]")
+
+    def write_large_doc(self, input_file: str, output) -> None:
+        """Convert a large XML file to a single JSONL line, writing it to output as it is computed.
+
+        The output is identical to that of convert_to_jsonl, but the document text is never joined into
+        a single string and the offsets are kept in integer arrays instead of lists of dictionaries.
+        """
+
+        with open(input_file, "r") as f:
+            tree = ET.parse(f)
+        root = tree.getroot()
+        xml_id = root.attrib.get(f"{XML_ID_NAMESPACE}id")
+        title, author, source, publish_timestamp = self.get_source_info(root)
+
+        fetch_timestamp = date.today().strftime("%Y-%m-%d")
+        gen_uuid = str(uuid.uuid4())
+        paragraphs = root[1][0]
+        paragraph_type = self.corpus_config["paragraph_type"]
+        title_type = self.corpus_config["title_type"]
+        title, title_info = self.get_title(title, title_type)
+
+        paragraph_offsets = array("q")
+        paragraph_lens = array("q")
+        sentence_offsets = array("q")
+        sentence_lens = array("q")
+
+        output.write('{"document": "')
+        position = 0
+        ends_with_newline = False
+        # The title is the first paragraph of the document
+        for p in itertools.chain(
+            [title], self.iter_paragraphs(paragraphs, paragraph_type)
+        ):
+            if paragraph_lens:
+                # Paragraphs are separated by two newlines
+                output.write("\\n\\n")
+                ends_with_newline = self.find_paragraph_breaks(
+                    "\n\n", position, ends_with_newline, paragraph_offsets
+                )
+                position += 2
+            output.write(json.dumps(p, ensure_ascii=False)[1:-1])
+            ends_with_newline = self.find_paragraph_breaks(
+                p, position, ends_with_newline, paragraph_offsets
+            )
+            paragraph_lens.append(len(p))
+
+            # Get the offset and length of each sentence
+            sentence_len = 0
+            for i, sentence in enumerate(split_into_sentences(p, original=True)):
+                if i == 0:
+                    sentence_offsets.append(position)
+                    sentence_lens.append(len(sentence))
+                else:
+                    sentence_offsets.append(position + sentence_len + 1)
+                    sentence_lens.append(len(sentence) - 2)
+                sentence_len += len(sentence)
+            position += len(p)
+        output.write('", "uuid": ')
+        output.write(json.dumps(gen_uuid))
+
+        title_metadata = (
+            {"offset": title_info[0], "length": title_info[1]}
+            if title_info[0] is not None
+            else None
+        )
+        output.write(', "metadata": {"author": ')
+        output.write(
+            json.dumps(
+                author[0].text if len(author) != 0 else None, ensure_ascii=False
+            )
+        )
+        output.write(', "fetch_timestamp": ')
+        output.write(json.dumps(fetch_timestamp))
+        output.write(', "xml_id": ')
+        output.write(json.dumps(xml_id, ensure_ascii=False))
+        output.write(', "publish_timestamp": ')
+        output.write(
+            json.dumps(
+                publish_timestamp[0].text if len(publish_timestamp) != 0 else None,
+                ensure_ascii=False,
+            )
+        )
+        output.write(', "title": ')
+        output.write(json.dumps(title_metadata))
+        output.write(', "paragraphs": ')
+        self.write_offsets(output, paragraph_offsets, paragraph_lens)
+        output.write(', "sentences": ')
+        self.write_offsets(output, sentence_offsets, sentence_lens)
+        output.write(', "source": ')
+        output.write(
+            json.dumps(source[0].text if len(source) != 0 else None, ensure_ascii=False)
+        )
+        output.write("}}\n")
+
+    def write_doc(self, input_file: str, output) -> None:
+        """Convert a single XML file and write it as a line to output, tracking peak memory if requested."""
+
+        if self.report_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        large_doc = os.path.getsize(input_file) >= self.large_doc_threshold
+        if large_doc:
+            self.write_large_doc(input_file, output)
+        else:
+            json.dump(self.convert_to_jsonl(input_file), output, ensure_ascii=False)
+            output.write("\n")
+
+        if self.report_memory:
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            self.memory_report.append(
+                (input_file, os.path.getsize(input_file), large_doc, peak)
+            )
+
+    def get_corpus_info(self, corpus_name: str, output_name: str) -> dict:
         """Get information on the corpus."""
 
-        updated_corpus_name = corpus_name
-        # Corpus names in info_map are sometimes slightly different from the actual corpus names
-        if corpus_name not in info_map:
-            if corpus_name == "IGC-Adjud-Appeal":
-                updated_corpus_name = "IGC-Adjud2"
-            elif corpus_name == "IGC-Adjud-District":
-                updated_corpus_name = "IGC-Adjud1"
-            elif corpus_name == "IGC-Adjud-Supreme":
-                updated_corpus_name = "IGC-Adjud3"
-            elif corpus_name == "IGC-Law-Bills":
-                updated_corpus_name = "IGC-Law2"
-            elif corpus_name == "IGC-Law-Law":
-                updated_corpus_name = "IGC-Law3"
-            elif corpus_name == "IGC-Law-Proposals":
-                updated_corpus_name = "IGC-Law1"
-            elif corpus_name == "IGC-News1-frettabladid_is":
-                updated_corpus_name = "IGC-News1-frettabladidis"
-            elif corpus_name == "IGC-News1-ras1_og_2":
-                updated_corpus_name = "IGC-News1-ras1og2"
-            elif corpus_name == "IGC-News2-dv_is":
-                updated_corpus_name = "IGC-News2-dvis"
-            elif corpus_name == "IGC-News2-frettatiminn_bl":
-                updated_corpus_name = "IGC-News2-frettatiminnbl"
-            elif corpus_name == "IGC-News2-kjarninn_blad":
-                updated_corpus_name = "IGC-News2-kjarninnblad"
-            elif corpus_name == "IGC-News2-stundin_blad":
-                updated_corpus_name = "IGC-News2-stundinblad"
-            elif corpus_name == "IGC-News2-stundin_serblad":
-                updated_corpus_name = "IGC-News2-stundinserblad"
-            elif corpus_name == "IGC-Social-Blog-heimur":
-                updated_corpus_name = "IGC-Social2-heimur"
-            elif corpus_name == "IGC-Social-Blog-jonas":
-                updated_corpus_name = "IGC-Social2-jonas"
-            elif corpus_name == "IGC-Social-Blog-silfuregils":
-                updated_corpus_name = "IGC-Social2-silfuregils"
-            elif corpus_name == "IGC-Social-Forums-bland":
-                updated_corpus_name = "IGC-Social1-bland"
-            elif corpus_name == "IGC-Social-Forums-hugi":
-                updated_corpus_name = "IGC-Social1-hugi"
-            elif corpus_name == "IGC-Social-Forums-malefnin":
-                updated_corpus_name = "IGC-Social1-malefnin"
+        info = self.registry.get_info(corpus_name)
 
         output_directory = os.path.join(
             self.output_path, "converted-corpora", f"IGC-{self.corpus}"
@@ -343,19 +435,17 @@ class XMLToJsonlConverter:
         corpus_info = {
             f"{corpus_name}": {
                 "path": os.path.join(os.path.abspath(output_directory), output_name),
-                "quality": info_map[updated_corpus_name]["quality"],
-                "domain": info_map[updated_corpus_name]["domain"],
-                "lang": info_map[updated_corpus_name]["lang"],
-                "version": self.input_path.split("/")[-2]
-                .split("-")[-1]
-                .rsplit(".", 1)[0],
+                "quality": info["quality"],
+                "domain": info["domain"],
+                "lang": info["lang"],
+                "version": self.version,
             }
         }
 
         return corpus_info
 
-    def write_to_jsonl(self, output_name: str, combined_files: list) -> None:
-        """Write the converted corpus to a single file."""
+    def write_to_jsonl(self, output_name: str, input_files: list) -> None:
+        """Convert the XML files and write them to a single file, one document at a time."""
 
         output_directory = os.path.join(
             self.output_path, "converted-corpora", f"IGC-{self.corpus}"
@@ -368,9 +458,8 @@ class XMLToJsonlConverter:
             "w",
         ) as output:
             print("Writing to:", os.path.join(output_directory, output_name))
-            for doc in combined_files:
-                json.dump(doc, output, ensure_ascii=False)
-                output.write("\n")
+            for input_file in input_files:
+                self.write_doc(input_file, output)
 
     def write_dataset_info(self, datasets_info: list) -> None:
         """Write the dataset information to a file."""
@@ -391,11 +480,31 @@ class XMLToJsonlConverter:
                 json.dump(line, datasets_output, ensure_ascii=False)
                 datasets_output.write("\n")
 
+    def write_memory_report(self) -> None:
+        """Write the peak memory used for each converted document to a file, largest first."""
+
+        output_directory = os.path.join(self.output_path, "memory-report")
+        if not os.path.exists(output_directory):
+            os.makedirs(output_directory)
+
+        output_file = os.path.join(output_directory, f"IGC-{self.corpus}.tsv")
+
+        print("Writing memory report to:", output_file)
+
+        with open(
+            output_file,
+            "w",
+        ) as report_output:
+            report_output.write("file\tsize_bytes\tlarge_doc\tpeak_bytes\n")
+            for input_file, size, large_doc, peak in sorted(
+                self.memory_report, key=lambda r: r[3], reverse=True
+            ):
+                report_output.write(f"{input_file}\t{size}\t{large_doc}\t{peak}\n")
+
     def create_jsonl_type1(self) -> None:
         """Convert all XML files, which are of type 1, in the input path to JSONL format and write the output to a file."""
 
         datasets_info = []
-        info_map = self.get_info_map()
 
         # Compile all data
         for subcorpus in sorted(os.listdir(self.input_path)):
@@ -403,11 +512,11 @@ class XMLToJsonlConverter:
                 subcorpus_name = f"IGC-{self.corpus}-{subcorpus}"
                 output_name = f"{subcorpus_name}.jsonl"
                 subcorpus_info = self.get_corpus_info(
-                    subcorpus_name, output_name, info_map
+                    subcorpus_name, output_name
                 )
                 datasets_info.append(subcorpus_info)
 
-                combined_files = []
+                input_files = []
 
                 print("Converting files for:", output_name)
 
@@ -421,11 +530,10 @@ class XMLToJsonlConverter:
                             input_file = os.path.join(
                                 self.input_path, subcorpus, year, file
                             )
-                            converted_file = self.convert_to_jsonl(input_file)
-                            combined_files.append(converted_file)
+                            input_files.append(input_file)
 
                 # Write the converted output to a file
-                self.write_to_jsonl(output_name, combined_files)
+                self.write_to_jsonl(output_name, input_files)
 
         # Write dataset info to a file
         self.write_dataset_info(datasets_info)
@@ -434,14 +542,13 @@ class XMLToJsonlConverter:
         """Convert all XML files, which are of type 2, in the input path to JSONL format and write the output to a file."""
 
         datasets_info = []
-        info_map = self.get_info_map()
 
         corpus_name = f"IGC-{self.corpus}"
         output_name = f"{corpus_name}.jsonl"
-        corpus_info = self.get_corpus_info(corpus_name, output_name, info_map)
+        corpus_info = self.get_corpus_info(corpus_name, output_name)
         datasets_info.append(corpus_info)
 
-        combined_files = []
+        input_files = []
 
         print("Converting files for:", output_name)
 
@@ -450,11 +557,10 @@ class XMLToJsonlConverter:
             if os.path.isdir(os.path.join(self.input_path, year)):
                 for file in sorted(os.listdir(os.path.join(self.input_path, year))):
                     input_file = os.path.join(self.input_path, year, file)
-                    converted_file = self.convert_to_jsonl(input_file)
-                    combined_files.append(converted_file)
+                    input_files.append(input_file)
 
         # Write the output to a file
-        self.write_to_jsonl(output_name, combined_files)
+        self.write_to_jsonl(output_name, input_files)
 
         # Write dataset info to a file
         self.write_dataset_info(datasets_info)
@@ -463,7 +569,6 @@ class XMLToJsonlConverter:
         """Convert all XML files, which are of type 3, in the input path to JSONL format and write the output to a file."""
 
         datasets_info = []
-        info_map = self.get_info_map()
 
         # Compile all data
         for subcorpus in sorted(os.listdir(self.input_path)):
@@ -471,11 +576,11 @@ class XMLToJsonlConverter:
                 subcorpus_name = f"IGC-{self.corpus}-{subcorpus}"
                 output_name = f"{subcorpus_name}.jsonl"
                 subcorpus_info = self.get_corpus_info(
-                    subcorpus_name, output_name, info_map
+                    subcorpus_name, output_name
                 )
                 datasets_info.append(subcorpus_info)
 
-                combined_files = []
+                input_files = []
 
                 print("Converting files for:", output_name)
 
@@ -503,11 +608,10 @@ class XMLToJsonlConverter:
                                         number,
                                         file,
                                     )
-                                    converted_file = self.convert_to_jsonl(input_file)
-                                    combined_files.append(converted_file)
+                                    input_files.append(input_file)
 
                 # Write the output to a file
-                self.write_to_jsonl(output_name, combined_files)
+                self.write_to_jsonl(output_name, input_files)
 
         # Write dataset info to a file
         self.write_dataset_info(datasets_info)
@@ -516,7 +620,6 @@ class XMLToJsonlConverter:
         """Convert all XML files, which are of type 4, in the input path to JSONL format and write the output to a file."""
 
         datasets_info = []
-        info_map = self.get_info_map()
 
         # Compile all data
         for type in sorted(os.listdir(self.input_path)):
@@ -531,11 +634,11 @@ class XMLToJsonlConverter:
                         subcorpus_name = f"IGC-{self.corpus}-{type}-{subcorpus}"
                         output_name = f"{subcorpus_name}.jsonl"
                         subcorpus_info = self.get_corpus_info(
-                            subcorpus_name, output_name, info_map
+                            subcorpus_name, output_name
                         )
                         datasets_info.append(subcorpus_info)
 
-                        combined_files = []
+                        input_files = []
 
                         print("Converting files for:", output_name)
 
@@ -555,18 +658,49 @@ class XMLToJsonlConverter:
                                     input_file = os.path.join(
                                         self.input_path, type, subcorpus, year, file
                                     )
-                                    converted_file = self.convert_to_jsonl(input_file)
-                                    combined_files.append(converted_file)
+                                    input_files.append(input_file)
 
                         # Write the output to a file
-                        self.write_to_jsonl(output_name, combined_files)
+                        self.write_to_jsonl(output_name, input_files)
 
         # Write dataset info to a file
         self.write_dataset_info(datasets_info)
 
-    def create_jsonl(self, corpus_type):
+    def get_subcorpus_names(self) -> list:
+        """Get the names of all subcorpora found in the input path, as they are named in the conversion."""
+
+        corpus_type = self.corpus_config["corpus_type"]
+        if corpus_type == 2:
+            return [f"IGC-{self.corpus}"]
+
+        subcorpus_names = []
+        for subcorpus in sorted(os.listdir(self.input_path)):
+            if not os.path.isdir(os.path.join(self.input_path, subcorpus)):
+                continue
+            if corpus_type in (1, 3):
+                subcorpus_names.append(f"IGC-{self.corpus}-{subcorpus}")
+            elif corpus_type == 4 and subcorpus != "Twitter":
+                # Twitter data is empty, so we don't include that in the conversion
+                for name in sorted(os.listdir(os.path.join(self.input_path, subcorpus))):
+                    if os.path.isdir(os.path.join(self.input_path, subcorpus, name)):
+                        subcorpus_names.append(f"IGC-{self.corpus}-{subcorpus}-{name}")
+
+        return subcorpus_names
+
+    def validate(self) -> list:
+        """Get the names of subcorpora in the input path which are missing from the corpus registry."""
+
+        return self.registry.validate(self.get_subcorpus_names())
+
+    def create_jsonl(self, corpus_type: int = None):
         """Convert the XML files in the input path to JSONL format based on the corpus type."""
 
+        if corpus_type is None:
+            corpus_type = self.corpus_config["corpus_type"]
+
+        if self.report_memory:
+            tracemalloc.start()
+
         if corpus_type == 1:
             self.create_jsonl_type1()
         elif corpus_type == 2:
@@ -575,3 +709,7 @@ class XMLToJsonlConverter:
             self.create_jsonl_type3()
         elif corpus_type == 4:
             self.create_jsonl_type4()
+
+        if self.report_memory:
+            tracemalloc.stop()
+            self.write_memory_report()
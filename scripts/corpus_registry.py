@@ -0,0 +1,140 @@
+import json
+import os
+from functools import lru_cache
+
+# Path to the TSV file containing information on the corpora, resolved relative to the repository
+# so that the conversion can be run from any directory
+INFO_MAP_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "subcorpora_categorization.tsv",
+)
+
+# Directory structure, paragraph type and title type for each subcorpus. The corpus types reflect the
+# different directory structure of the IGC subcorpora. If new subcorpora are added, they need to be listed here.
+CORPORA = {
+    "Adjud": {"corpus_type": 1, "paragraph_type": 1, "title_type": 1},
+    "Journals": {"corpus_type": 1, "paragraph_type": 1, "title_type": 1},
+    "Law": {"corpus_type": 1, "paragraph_type": 1, "title_type": 2},
+    "Books": {"corpus_type": 2, "paragraph_type": 1, "title_type": 1},
+    "Parla": {"corpus_type": 2, "paragraph_type": 2, "title_type": 3},
+    "Wiki": {"corpus_type": 2, "paragraph_type": 1, "title_type": 1},
+    "News1": {"corpus_type": 3, "paragraph_type": 1, "title_type": 1},
+    "News2": {"corpus_type": 3, "paragraph_type": 1, "title_type": 1},
+    "Social": {"corpus_type": 4, "paragraph_type": 1, "title_type": 1},
+}
+
+# Corpus names in the TSV file are sometimes slightly different from the directory names in the IGC
+CORPUS_ALIASES = {
+    "IGC-Adjud-Appeal": "IGC-Adjud2",
+    "IGC-Adjud-District": "IGC-Adjud1",
+    "IGC-Adjud-Supreme": "IGC-Adjud3",
+    "IGC-Law-Bills": "IGC-Law2",
+    "IGC-Law-Law": "IGC-Law3",
+    "IGC-Law-Proposals": "IGC-Law1",
+    "IGC-News1-frettabladid_is": "IGC-News1-frettabladidis",
+    "IGC-News1-ras1_og_2": "IGC-News1-ras1og2",
+    "IGC-News2-dv_is": "IGC-News2-dvis",
+    "IGC-News2-frettatiminn_bl": "IGC-News2-frettatiminnbl",
+    "IGC-News2-kjarninn_blad": "IGC-News2-kjarninnblad",
+    "IGC-News2-stundin_blad": "IGC-News2-stundinblad",
+    "IGC-News2-stundin_serblad": "IGC-News2-stundinserblad",
+    "IGC-Social-Blog-heimur": "IGC-Social2-heimur",
+    "IGC-Social-Blog-jonas": "IGC-Social2-jonas",
+    "IGC-Social-Blog-silfuregils": "IGC-Social2-silfuregils",
+    "IGC-Social-Forums-bland": "IGC-Social1-bland",
+    "IGC-Social-Forums-hugi": "IGC-Social1-hugi",
+    "IGC-Social-Forums-malefnin": "IGC-Social1-malefnin",
+}
+
+
+class CorpusRegistry:
+    """Information on all IGC subcorpora, with an index from every known name to its entry in the info map."""
+
+    def __init__(self, corpora: dict, info_map: dict, aliases: dict) -> None:
+        self.corpora = corpora
+        self.info_map = info_map
+        self.aliases = aliases
+        # Every alias resolves to the name it stands for, and every name in the info map to itself
+        self.alias_index = {
+            alias: name for alias, name in aliases.items() if name in info_map
+        }
+        self.alias_index.update({name: name for name in info_map})
+        self._serialized = None
+
+    @classmethod
+    def from_tsv(cls, info_map_file: str = INFO_MAP_FILE) -> "CorpusRegistry":
+        """Create the registry from the TSV file containing information on the corpora."""
+
+        with open(info_map_file, "r") as f:
+            info_map = {}
+            # Skip the header in the file
+            next(f)
+            for line in f:
+                info = line.split("\t")
+                corpus_name = info[0].split(".tsv")[0]
+                domain = info[1].lower()
+                if "–" in domain:
+                    domain = [d.strip() for d in domain.split("–")]
+                else:
+                    domain = [domain]
+                lang = "is"
+                quality = info[-1].strip()
+                info_map[corpus_name] = {
+                    "domain": domain,
+                    "lang": lang,
+                    "quality": quality,
+                }
+
+        return cls(CORPORA, info_map, CORPUS_ALIASES)
+
+    @classmethod
+    def from_serialized(cls, serialized: str) -> "CorpusRegistry":
+        """Create the registry from its serialized form, e.g. in a worker process."""
+
+        data = json.loads(serialized)
+        registry = cls(data["corpora"], data["info_map"], data["aliases"])
+        registry._serialized = serialized
+
+        return registry
+
+    def serialize(self) -> str:
+        """Get the serialized form of the registry, which is only computed once."""
+
+        if self._serialized is None:
+            self._serialized = json.dumps(
+                {
+                    "corpora": self.corpora,
+                    "info_map": self.info_map,
+                    "aliases": self.aliases,
+                },
+                ensure_ascii=False,
+            )
+
+        return self._serialized
+
+    def resolve(self, corpus_name: str) -> str:
+        """Get the name in the info map for a subcorpus name, raising a KeyError if it is unknown."""
+
+        if corpus_name not in self.alias_index:
+            raise KeyError(
+                f"{corpus_name} is not listed in {os.path.basename(INFO_MAP_FILE)} or CORPUS_ALIASES"
+            )
+
+        return self.alias_index[corpus_name]
+
+    def get_info(self, corpus_name: str) -> dict:
+        """Get the domain, language and quality of a subcorpus."""
+
+        return self.info_map[self.resolve(corpus_name)]
+
+    def validate(self, corpus_names: list) -> list:
+        """Get the subcorpus names which do not resolve to an entry in the info map."""
+
+        return [name for name in corpus_names if name not in self.alias_index]
+
+
+@lru_cache(maxsize=None)
+def get_registry() -> CorpusRegistry:
+    """Get the corpus registry, which is loaded once and shared by all converters."""
+
+    return CorpusRegistry.from_tsv()